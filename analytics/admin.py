@@ -16,6 +16,8 @@ class SessionAdmin(admin.ModelAdmin):
     list_display = ('session_key', 'project', 'user_id', 'start_time', 'end_time')
     search_fields = ('session_key', 'user_id')
     list_filter = ('start_time', 'end_time', 'project')
+    list_per_page = 50
+    show_full_result_count = False
 
 
 @admin.register(Event)
@@ -23,6 +25,10 @@ class EventAdmin(admin.ModelAdmin):
     list_display = ('event_type', 'project', 'session', 'timestamp')
     search_fields = ('event_type',)
     list_filter = ('event_type', 'timestamp', 'project')
+    list_per_page = 50
+    show_full_result_count = False
+    raw_id_fields = ('project', 'session')
+    ordering = ('-timestamp',)
 
 
 @admin.register(UserPrompt)
@@ -30,6 +36,10 @@ class UserPromptAdmin(admin.ModelAdmin):
     list_display = ('id', 'get_event_type', 'get_project', 'model_name', 'tokens')
     search_fields = ('prompt_text', 'model_name')
     list_filter = ('model_name',)
+    list_select_related = ('event', 'event__project')
+    list_per_page = 50
+    show_full_result_count = False
+    raw_id_fields = ('event', 'project')
     
     def get_event_type(self, obj):
         return obj.event.event_type
@@ -45,6 +55,10 @@ class AIResponseAdmin(admin.ModelAdmin):
     list_display = ('id', 'get_event_type', 'get_project', 'model_name', 'tokens', 'latency')
     search_fields = ('response_text', 'model_name')
     list_filter = ('model_name',)
+    list_select_related = ('event', 'event__project')
+    list_per_page = 50
+    show_full_result_count = False
+    raw_id_fields = ('event', 'project', 'prompt')
     
     def get_event_type(self, obj):
         return obj.event.event_type
@@ -60,6 +74,10 @@ class FeedbackAdmin(admin.ModelAdmin):
     list_display = ('id', 'get_event_type', 'get_project', 'rating')
     search_fields = ('comment',)
     list_filter = ('rating',)
+    list_select_related = ('event', 'event__project')
+    list_per_page = 50
+    show_full_result_count = False
+    raw_id_fields = ('event', 'project', 'response')
     
     def get_event_type(self, obj):
         return obj.event.event_type
@@ -89,3 +107,4 @@ class WidgetAdmin(admin.ModelAdmin):
     list_display = ('title', 'dashboard', 'widget_type')
     search_fields = ('title',)
     list_filter = ('widget_type', 'dashboard')
+    raw_id_fields = ('dashboard',)
@@ -0,0 +1,33 @@
+from django.utils.functional import SimpleLazyObject
+
+from .models import Project
+
+
+def accessible_project_ids(user):
+    """
+    Ids of the projects the given user owns or is a member of, as a
+    UNION of two cheap queries. Filtering on these ids avoids the M2M
+    LEFT JOIN plus SELECT DISTINCT over wide rows that the old
+    Q(owner=user) | Q(members=user) pattern required.
+    """
+    owned = Project.objects.filter(owner=user).values_list('id', flat=True)
+    member = Project.objects.filter(members=user).values_list('id', flat=True)
+    return set(owned.union(member))
+
+
+class AccessibleProjectsMiddleware:
+    """
+    Attaches request.accessible_project_ids so the permission scope is
+    computed at most once per request instead of once per viewset. The
+    set is lazy: it isn't queried until a view filters on it, which
+    also means it sees the user as authenticated by DRF.
+    """
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        request.accessible_project_ids = SimpleLazyObject(
+            lambda: accessible_project_ids(request.user)
+            if request.user.is_authenticated else set()
+        )
+        return self.get_response(request)
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.17 on 2026-08-31 00:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('analytics', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(fields=['project', '-timestamp'], name='analytics_e_project_0f8696_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(fields=['project', 'event_type', '-timestamp'], name='analytics_e_project_693a52_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(fields=['session', '-timestamp'], name='analytics_e_session_55fd3a_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='session',
+            index=models.Index(fields=['project', '-start_time'], name='analytics_s_project_9ee235_idx'),
+        ),
+    ]
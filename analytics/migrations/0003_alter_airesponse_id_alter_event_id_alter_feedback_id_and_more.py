@@ -0,0 +1,34 @@
+# Generated by Django 5.2.17 on 2026-08-31 00:56
+
+import analytics.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('analytics', '0002_event_analytics_e_project_0f8696_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='airesponse',
+            name='id',
+            field=models.UUIDField(default=analytics.models.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='event',
+            name='id',
+            field=models.UUIDField(default=analytics.models.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='feedback',
+            name='id',
+            field=models.UUIDField(default=analytics.models.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='userprompt',
+            name='id',
+            field=models.UUIDField(default=analytics.models.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+    ]
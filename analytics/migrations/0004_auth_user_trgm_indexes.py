@@ -0,0 +1,44 @@
+"""
+Trigram (pg_trgm) GIN indexes on the auth_user columns searched by
+UserViewSet. DRF's SearchFilter turns ?search=q into ILIKE '%q%' ORed
+across username, email, first_name and last_name, which without these
+indexes is always a sequential scan; with one trigram index per column
+PostgreSQL can answer the OR with a bitmap of index scans.
+
+PostgreSQL-only: on other backends (the default SQLite dev database)
+this migration is a no-op.
+"""
+from django.db import migrations
+
+SEARCH_COLUMNS = ('username', 'email', 'first_name', 'last_name')
+
+
+def create_trgm_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm;")
+        for column in SEARCH_COLUMNS:
+            cursor.execute(
+                f"CREATE INDEX IF NOT EXISTS auth_user_{column}_trgm "
+                f"ON auth_user USING gin ({column} gin_trgm_ops);"
+            )
+
+
+def drop_trgm_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    with schema_editor.connection.cursor() as cursor:
+        for column in SEARCH_COLUMNS:
+            cursor.execute(f"DROP INDEX IF EXISTS auth_user_{column}_trgm;")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('analytics', '0003_alter_airesponse_id_alter_event_id_alter_feedback_id_and_more'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trgm_indexes, drop_trgm_indexes),
+    ]
@@ -0,0 +1,51 @@
+# Generated by Django 5.2.17 on 2026-08-31 00:58
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count
+from django.db.models.functions import TruncDate
+
+
+def backfill_daily_counts(apps, schema_editor):
+    """Seed the counter table from existing events so the stats
+    breakdown agrees with the live totals on upgraded databases"""
+    Event = apps.get_model('analytics', 'Event')
+    EventDailyCount = apps.get_model('analytics', 'EventDailyCount')
+    rows = (
+        Event.objects
+        .annotate(day=TruncDate('timestamp'))
+        .values('project_id', 'day', 'event_type')
+        .annotate(total=Count('id'))
+    )
+    EventDailyCount.objects.bulk_create(
+        (
+            EventDailyCount(project_id=row['project_id'], day=row['day'],
+                            event_type=row['event_type'], count=row['total'])
+            for row in rows
+        ),
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('analytics', '0004_auth_user_trgm_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EventDailyCount',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField()),
+                ('event_type', models.CharField(choices=[('user_prompt', 'User Prompt'), ('ai_response', 'AI Response'), ('user_feedback', 'User Feedback'), ('user_action', 'User Action'), ('error', 'Error'), ('other', 'Other')], max_length=50)),
+                ('count', models.IntegerField(default=0)),
+                ('project', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='daily_counts', to='analytics.project')),
+            ],
+            options={
+                'unique_together': {('project', 'day', 'event_type')},
+            },
+        ),
+        migrations.RunPython(backfill_daily_counts, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,39 @@
+# Generated by Django 5.2.17 on 2026-08-31 01:01
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('analytics', '0005_eventdailycount'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='airesponse',
+            name='project',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='analytics.project'),
+        ),
+        migrations.AddField(
+            model_name='feedback',
+            name='project',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='analytics.project'),
+        ),
+        migrations.AddField(
+            model_name='userprompt',
+            name='project',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='analytics.project'),
+        ),
+        migrations.AlterField(
+            model_name='airesponse',
+            name='model_name',
+            field=models.CharField(db_index=True, max_length=100),
+        ),
+        migrations.AlterField(
+            model_name='userprompt',
+            name='model_name',
+            field=models.CharField(blank=True, db_index=True, max_length=100),
+        ),
+    ]
@@ -0,0 +1,29 @@
+"""
+Backfill the denormalized project column on UserPrompt, AIResponse and
+Feedback from each row's event.
+"""
+from django.db import migrations
+from django.db.models import OuterRef, Subquery
+
+CHILD_MODELS = ('UserPrompt', 'AIResponse', 'Feedback')
+
+
+def backfill_project(apps, schema_editor):
+    Event = apps.get_model('analytics', 'Event')
+    event_project = Subquery(
+        Event.objects.filter(pk=OuterRef('event_id')).values('project_id')[:1]
+    )
+    for name in CHILD_MODELS:
+        model = apps.get_model('analytics', name)
+        model.objects.filter(project__isnull=True).update(project_id=event_project)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('analytics', '0006_airesponse_project_feedback_project_and_more'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_project, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.17 on 2026-08-31 01:02
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('analytics', '0007_backfill_child_project'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='event',
+            options={},
+        ),
+    ]
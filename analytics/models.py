@@ -1,10 +1,29 @@
 from django.db import models
 from django.contrib.auth.models import User
 from django.utils import timezone
+import secrets
+import time
 import uuid
 import json
 
 
+def uuid7():
+    """
+    Time-ordered UUID (RFC 9562 version 7): 48 bits of unix millis
+    followed by random bits. New ids sort after existing ones, so
+    primary-key B-tree inserts on the high-write tables append to the
+    rightmost leaf instead of hitting random pages like uuid4 does.
+    """
+    timestamp_ms = time.time_ns() // 1_000_000
+    rand = secrets.randbits(74)
+    value = (timestamp_ms & ((1 << 48) - 1)) << 80
+    value |= 0x7 << 76                    # version
+    value |= (rand >> 62) << 64           # rand_a
+    value |= 0b10 << 62                   # variant
+    value |= rand & ((1 << 62) - 1)       # rand_b
+    return uuid.UUID(int=value)
+
+
 class Project(models.Model):
     """Project model to organize analytics data"""
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
@@ -28,7 +47,12 @@ class Session(models.Model):
     start_time = models.DateTimeField(default=timezone.now)
     end_time = models.DateTimeField(null=True, blank=True)
     metadata = models.JSONField(default=dict, blank=True)
-    
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['project', '-start_time']),
+        ]
+
     def __str__(self):
         return f"Session {self.session_key} - {self.start_time}"
     
@@ -49,7 +73,7 @@ class Event(models.Model):
         ('other', 'Other'),
     )
     
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     project = models.ForeignKey(Project, on_delete=models.CASCADE, related_name='events')
     session = models.ForeignKey(Session, on_delete=models.CASCADE, related_name='events', null=True, blank=True)
     event_type = models.CharField(max_length=50, choices=EVENT_TYPES)
@@ -57,34 +81,79 @@ class Event(models.Model):
     metadata = models.JSONField(default=dict, blank=True)
     
     class Meta:
-        ordering = ['-timestamp']
-    
+        # No default ordering: list paths order explicitly after
+        # filtering by project so the (project, -timestamp) index can
+        # serve the sort, and aggregates skip the ORDER BY entirely
+        indexes = [
+            models.Index(fields=['project', '-timestamp']),
+            models.Index(fields=['project', 'event_type', '-timestamp']),
+            models.Index(fields=['session', '-timestamp']),
+        ]
+
     def __str__(self):
         return f"{self.event_type} at {self.timestamp}"
 
 
+class EventDailyCount(models.Model):
+    """
+    Per-project, per-day, per-event_type event counters maintained on
+    Event writes (see signals.py) so dashboard breakdowns read a few
+    small rows instead of scanning the events table.
+    """
+    project = models.ForeignKey(Project, on_delete=models.CASCADE, related_name='daily_counts')
+    day = models.DateField()
+    event_type = models.CharField(max_length=50, choices=Event.EVENT_TYPES)
+    count = models.IntegerField(default=0)
+
+    class Meta:
+        unique_together = ('project', 'day', 'event_type')
+
+    def __str__(self):
+        return f"{self.project_id} {self.day} {self.event_type}: {self.count}"
+
+
 class UserPrompt(models.Model):
     """Model to store user prompts/queries to AI models"""
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     event = models.OneToOneField(Event, on_delete=models.CASCADE, related_name='user_prompt')
+    # Denormalized from event.project so project filters skip the JOIN
+    project = models.ForeignKey(Project, on_delete=models.CASCADE, related_name='+',
+                                null=True, blank=True)
     prompt_text = models.TextField()
-    model_name = models.CharField(max_length=100, blank=True)
+    model_name = models.CharField(max_length=100, blank=True, db_index=True)
     tokens = models.IntegerField(default=0)
-    
+
+    def save(self, *args, **kwargs):
+        # Fill the denormalized project from the event on write paths
+        # that don't set it explicitly (API feedback/admin saves)
+        if self.project_id is None and self.event_id:
+            self.project_id = self.event.project_id
+        super().save(*args, **kwargs)
+
     def __str__(self):
         return f"Prompt: {self.prompt_text[:50]}..."
 
 
 class AIResponse(models.Model):
     """Model to store AI model responses"""
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     event = models.OneToOneField(Event, on_delete=models.CASCADE, related_name='ai_response')
+    # Denormalized from event.project so project filters skip the JOIN
+    project = models.ForeignKey(Project, on_delete=models.CASCADE, related_name='+',
+                                null=True, blank=True)
     prompt = models.ForeignKey(UserPrompt, on_delete=models.CASCADE, related_name='responses', null=True, blank=True)
     response_text = models.TextField()
-    model_name = models.CharField(max_length=100)
+    model_name = models.CharField(max_length=100, db_index=True)
     tokens = models.IntegerField(default=0)
     latency = models.FloatField(default=0.0)  # Response time in seconds
-    
+
+    def save(self, *args, **kwargs):
+        # Fill the denormalized project from the event on write paths
+        # that don't set it explicitly (API feedback/admin saves)
+        if self.project_id is None and self.event_id:
+            self.project_id = self.event.project_id
+        super().save(*args, **kwargs)
+
     def __str__(self):
         return f"Response: {self.response_text[:50]}..."
 
@@ -99,13 +168,23 @@ class Feedback(models.Model):
         (5, '5 - Excellent'),
     )
     
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     event = models.OneToOneField(Event, on_delete=models.CASCADE, related_name='feedback')
+    # Denormalized from event.project so project filters skip the JOIN
+    project = models.ForeignKey(Project, on_delete=models.CASCADE, related_name='+',
+                                null=True, blank=True)
     response = models.ForeignKey(AIResponse, on_delete=models.CASCADE, related_name='feedback_items')
     rating = models.IntegerField(choices=RATING_CHOICES, null=True, blank=True)
     comment = models.TextField(blank=True)
     tags = models.JSONField(default=list, blank=True)
-    
+
+    def save(self, *args, **kwargs):
+        # Fill the denormalized project from the event on write paths
+        # that don't set it explicitly (API feedback/admin saves)
+        if self.project_id is None and self.event_id:
+            self.project_id = self.event.project_id
+        super().save(*args, **kwargs)
+
     def __str__(self):
         return f"Feedback on {self.response} - Rating: {self.rating}"
 
@@ -1,9 +1,14 @@
+from collections import Counter
+
 from rest_framework import serializers
 from django.contrib.auth.models import User
+from django.db import transaction
+from django.utils import timezone
 from .models import (
-    Project, Session, Event, UserPrompt, 
+    Project, Session, Event, UserPrompt,
     AIResponse, Feedback, Tag, Dashboard, Widget
 )
+from .signals import adjust_daily_count, bump_stats_version
 
 
 class UserSerializer(serializers.ModelSerializer):
@@ -29,14 +34,13 @@ class ProjectSerializer(serializers.ModelSerializer):
 
 
 class SessionSerializer(serializers.ModelSerializer):
-    duration = serializers.SerializerMethodField()
-    
+    # Read from the duration_sec queryset annotation (SessionViewSet)
+    # rather than recomputing per row in Python
+    duration = serializers.DurationField(source='duration_sec', read_only=True, default=None)
+
     class Meta:
         model = Session
         fields = ['id', 'project', 'user_id', 'session_key', 'start_time', 'end_time', 'metadata', 'duration']
-    
-    def get_duration(self, obj):
-        return obj.duration()
 
 
 class UserPromptSerializer(serializers.ModelSerializer):
@@ -45,12 +49,26 @@ class UserPromptSerializer(serializers.ModelSerializer):
         fields = ['id', 'event', 'prompt_text', 'model_name', 'tokens']
 
 
+class UserPromptListSerializer(serializers.ModelSerializer):
+    """Lightweight prompt serializer for list views (omits prompt_text)"""
+    class Meta:
+        model = UserPrompt
+        fields = ['id', 'event', 'model_name', 'tokens']
+
+
 class AIResponseSerializer(serializers.ModelSerializer):
     class Meta:
         model = AIResponse
         fields = ['id', 'event', 'prompt', 'response_text', 'model_name', 'tokens', 'latency']
 
 
+class AIResponseListSerializer(serializers.ModelSerializer):
+    """Lightweight response serializer for list views (omits response_text)"""
+    class Meta:
+        model = AIResponse
+        fields = ['id', 'event', 'prompt', 'model_name', 'tokens', 'latency']
+
+
 class FeedbackSerializer(serializers.ModelSerializer):
     class Meta:
         model = Feedback
@@ -102,36 +120,90 @@ class FeedbackCreateSerializer(serializers.ModelSerializer):
         fields = ['rating', 'comment', 'tags']
 
 
+class EventBulkCreateSerializer(serializers.ListSerializer):
+    """
+    List serializer for ingestion bursts: writes all events and their
+    nested children with bulk_create instead of one INSERT per row.
+    """
+    @transaction.atomic
+    def create(self, validated_data):
+        events = []
+        pending = []
+        for item in validated_data:
+            user_prompt_data = item.pop('user_prompt', None)
+            ai_response_data = item.pop('ai_response', None)
+            feedback_data = item.pop('feedback', None)
+            event = Event(**item)
+            events.append(event)
+            pending.append((event, user_prompt_data, ai_response_data, feedback_data))
+
+        Event.objects.bulk_create(events, batch_size=1000)
+
+        # Children can reference their parents before the parents'
+        # bulk_create runs because UUID pks are assigned on instantiation
+        prompts, responses, feedback_items = [], [], []
+        for event, user_prompt_data, ai_response_data, feedback_data in pending:
+            prompt = None
+            if user_prompt_data:
+                prompt = UserPrompt(event=event, project_id=event.project_id, **user_prompt_data)
+                prompts.append(prompt)
+            response = None
+            if ai_response_data:
+                response = AIResponse(event=event, project_id=event.project_id,
+                                      prompt=prompt, **ai_response_data)
+                responses.append(response)
+            if feedback_data:
+                feedback_items.append(Feedback(event=event, project_id=event.project_id,
+                                               response=response, **feedback_data))
+
+        UserPrompt.objects.bulk_create(prompts, batch_size=1000)
+        AIResponse.objects.bulk_create(responses, batch_size=1000)
+        Feedback.objects.bulk_create(feedback_items, batch_size=1000)
+
+        # bulk_create bypasses post_save signals, so maintain the daily
+        # counters and stats cache invalidation here (see signals.py)
+        deltas = Counter()
+        for event in events:
+            deltas[(event.project_id, timezone.localdate(event.timestamp), event.event_type)] += 1
+        for (project_id, day, event_type), delta in deltas.items():
+            adjust_daily_count(project_id, day, event_type, delta)
+        for project_id in {event.project_id for event in events}:
+            bump_stats_version(project_id)
+
+        return events
+
+
 class EventCreateSerializer(serializers.ModelSerializer):
     user_prompt = UserPromptCreateSerializer(required=False)
     ai_response = AIResponseCreateSerializer(required=False)
     feedback = FeedbackCreateSerializer(required=False)
-    
+
     class Meta:
         model = Event
-        fields = ['project', 'session', 'event_type', 'timestamp', 'metadata', 
+        fields = ['project', 'session', 'event_type', 'timestamp', 'metadata',
                  'user_prompt', 'ai_response', 'feedback']
+        list_serializer_class = EventBulkCreateSerializer
     
+    @transaction.atomic
     def create(self, validated_data):
         user_prompt_data = validated_data.pop('user_prompt', None)
         ai_response_data = validated_data.pop('ai_response', None)
         feedback_data = validated_data.pop('feedback', None)
-        
+
         event = Event.objects.create(**validated_data)
-        
+
+        prompt = None
         if user_prompt_data:
-            UserPrompt.objects.create(event=event, **user_prompt_data)
-        
+            prompt = UserPrompt.objects.create(
+                event=event, project_id=event.project_id, **user_prompt_data)
+
+        response = None
         if ai_response_data:
-            prompt = None
-            if user_prompt_data:
-                prompt = event.user_prompt
-            AIResponse.objects.create(event=event, prompt=prompt, **ai_response_data)
-        
+            response = AIResponse.objects.create(
+                event=event, project_id=event.project_id, prompt=prompt, **ai_response_data)
+
         if feedback_data:
-            response = None
-            if ai_response_data:
-                response = event.ai_response
-            Feedback.objects.create(event=event, response=response, **feedback_data)
-        
+            Feedback.objects.create(
+                event=event, project_id=event.project_id, response=response, **feedback_data)
+
         return event 
\ No newline at end of file
@@ -0,0 +1,91 @@
+from django.core.cache import cache
+from django.db.models import F
+from django.db.models.signals import pre_save, post_save, post_delete
+from django.dispatch import receiver
+from django.utils import timezone
+
+from .models import Event, EventDailyCount, Feedback, Session
+
+
+def stats_version_key(project_id):
+    """Cache key holding the stats version counter for a project"""
+    return f"projstats:ver:{project_id}"
+
+
+def bump_stats_version(project_id):
+    """
+    Increment the per-project stats version so cached stats responses
+    keyed on the old version are no longer served.
+    """
+    key = stats_version_key(project_id)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, 1, timeout=None)
+
+
+def adjust_daily_count(project_id, day, event_type, delta):
+    """Apply a delta to the (project, day, event_type) counter row"""
+    counter, _ = EventDailyCount.objects.get_or_create(
+        project_id=project_id, day=day, event_type=event_type
+    )
+    EventDailyCount.objects.filter(pk=counter.pk).update(count=F('count') + delta)
+
+
+@receiver(post_save, sender=Event)
+def count_event_on_save(sender, instance, created, **kwargs):
+    if created:
+        day = timezone.localdate(instance.timestamp)
+        adjust_daily_count(instance.project_id, day, instance.event_type, 1)
+
+
+@receiver(pre_save, sender=Event)
+def move_count_on_event_update(sender, instance, **kwargs):
+    # An update may change project, timestamp or event_type, moving the
+    # event between counter buckets; compare against the stored row and
+    # shift the count so EventDailyCount doesn't drift
+    if instance._state.adding:
+        return
+    old = Event.objects.filter(pk=instance.pk).values(
+        'project_id', 'timestamp', 'event_type'
+    ).first()
+    if old is None:
+        return
+    old_bucket = (old['project_id'], timezone.localdate(old['timestamp']), old['event_type'])
+    new_bucket = (instance.project_id, timezone.localdate(instance.timestamp), instance.event_type)
+    if old_bucket == new_bucket:
+        return
+    EventDailyCount.objects.filter(
+        project_id=old_bucket[0], day=old_bucket[1], event_type=old_bucket[2]
+    ).update(count=F('count') - 1)
+    adjust_daily_count(*new_bucket, 1)
+
+
+@receiver(post_delete, sender=Event)
+def count_event_on_delete(sender, instance, **kwargs):
+    # Update-only on purpose: count_event_on_save created the counter
+    # row on insert, and during a cascading Project delete the counter
+    # rows go first — re-creating one here would reference a project
+    # that is mid-deletion and break the cascade
+    day = timezone.localdate(instance.timestamp)
+    EventDailyCount.objects.filter(
+        project_id=instance.project_id, day=day, event_type=instance.event_type
+    ).update(count=F('count') - 1)
+
+
+@receiver(post_save, sender=Event)
+@receiver(post_delete, sender=Event)
+def invalidate_stats_on_event_change(sender, instance, **kwargs):
+    bump_stats_version(instance.project_id)
+
+
+@receiver(post_save, sender=Feedback)
+@receiver(post_delete, sender=Feedback)
+def invalidate_stats_on_feedback_change(sender, instance, **kwargs):
+    bump_stats_version(instance.event.project_id)
+
+
+@receiver(post_save, sender=Session)
+@receiver(post_delete, sender=Session)
+def invalidate_stats_on_session_change(sender, instance, **kwargs):
+    bump_stats_version(instance.project_id)
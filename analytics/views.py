@@ -1,22 +1,49 @@
+import orjson
+
 from django.shortcuts import render
+from django.http import StreamingHttpResponse
 from rest_framework import viewsets, permissions, status, filters
 from rest_framework.decorators import action
 from rest_framework.response import Response
-from django.db.models import Count, Avg, Sum, F, Q
+from django.core.cache import cache
+from django.db.models import Count, Avg, Sum, F, ExpressionWrapper, DurationField
 from django.utils import timezone
 from django.contrib.auth.models import User
 from datetime import timedelta
 
 from .models import (
-    Project, Session, Event, UserPrompt, 
+    Project, Session, Event, EventDailyCount, UserPrompt,
     AIResponse, Feedback, Tag, Dashboard, Widget
 )
 from .serializers import (
     ProjectSerializer, SessionSerializer, EventSerializer, 
-    UserPromptSerializer, AIResponseSerializer, FeedbackSerializer,
+    UserPromptSerializer, UserPromptListSerializer,
+    AIResponseSerializer, AIResponseListSerializer, FeedbackSerializer,
     TagSerializer, DashboardSerializer, WidgetSerializer,
     EventCreateSerializer, UserSerializer
 )
+from .signals import stats_version_key
+
+# How long cached stats responses live; writes bump the per-project
+# version (see signals.py) so stale entries stop being read earlier
+STATS_CACHE_TIMEOUT = 60
+
+
+def stream_events(queryset):
+    """
+    Stream a queryset of events as one JSON array with bounded memory:
+    rows come through iterator() in chunks and are encoded one at a
+    time instead of materializing and serializing the whole list.
+    """
+    def generate():
+        yield b'['
+        first = True
+        for event in queryset.iterator(chunk_size=500):
+            prefix = b'' if first else b','
+            first = False
+            yield prefix + orjson.dumps(EventSerializer(event).data, default=str)
+        yield b']'
+    return StreamingHttpResponse(generate(), content_type='application/json')
 
 
 class IsOwnerOrReadOnly(permissions.BasePermission):
@@ -52,8 +79,9 @@ class ProjectViewSet(viewsets.ModelViewSet):
         This view should return a list of all projects
         for the currently authenticated user.
         """
-        user = self.request.user
-        return Project.objects.filter(Q(owner=user) | Q(members=user)).distinct()
+        return Project.objects.filter(
+            id__in=self.request.accessible_project_ids
+        ).select_related('owner').prefetch_related('members', 'tags')
     
     def perform_create(self, serializer):
         serializer.save(owner=self.request.user)
@@ -86,50 +114,58 @@ class ProjectViewSet(viewsets.ModelViewSet):
         Get project statistics
         """
         project = self.get_object()
-        
+
         # Time range filter
         days = int(request.query_params.get('days', 30))
         start_date = timezone.now() - timedelta(days=days)
-        
+
+        # Serve from cache if a fresh copy exists for this project/window
+        version = cache.get(stats_version_key(project.id), 0)
+        cache_key = f"projstats:{project.id}:{days}:v{version}"
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return Response(cached)
+
         # Get events in the time range
         events = Event.objects.filter(project=project, timestamp__gte=start_date)
-        
-        # Calculate statistics
-        total_events = events.count()
-        event_types = events.values('event_type').annotate(count=Count('id'))
-        
-        # User prompts stats
-        prompts = UserPrompt.objects.filter(event__project=project, event__timestamp__gte=start_date)
-        total_prompts = prompts.count()
-        avg_prompt_tokens = prompts.aggregate(avg_tokens=Avg('tokens'))['avg_tokens'] or 0
-        
-        # AI responses stats
-        responses = AIResponse.objects.filter(event__project=project, event__timestamp__gte=start_date)
-        total_responses = responses.count()
-        avg_response_tokens = responses.aggregate(avg_tokens=Avg('tokens'))['avg_tokens'] or 0
-        avg_latency = responses.aggregate(avg_latency=Avg('latency'))['avg_latency'] or 0
-        
-        # Feedback stats
-        feedback = Feedback.objects.filter(event__project=project, event__timestamp__gte=start_date)
-        total_feedback = feedback.count()
-        avg_rating = feedback.aggregate(avg_rating=Avg('rating'))['avg_rating'] or 0
-        
-        # Sessions stats
-        sessions = Session.objects.filter(project=project, start_time__gte=start_date)
-        total_sessions = sessions.count()
-        
-        return Response({
-            'total_events': total_events,
-            'event_types': event_types,
-            'total_prompts': total_prompts,
-            'avg_prompt_tokens': avg_prompt_tokens,
-            'total_responses': total_responses,
-            'avg_response_tokens': avg_response_tokens,
-            'avg_latency': avg_latency,
-            'total_feedback': total_feedback,
-            'avg_rating': avg_rating,
+
+        # Event, prompt, response and feedback statistics in a single
+        # SELECT: the one-to-one children are LEFT JOINed, so counting
+        # and averaging over them doesn't duplicate event rows
+        totals = events.aggregate(
+            total_events=Count('id'),
+            total_prompts=Count('user_prompt'),
+            avg_prompt_tokens=Avg('user_prompt__tokens'),
+            total_responses=Count('ai_response'),
+            avg_response_tokens=Avg('ai_response__tokens'),
+            avg_latency=Avg('ai_response__latency'),
+            total_feedback=Count('feedback'),
+            avg_rating=Avg('feedback__rating'),
+        )
+
+        # Event type breakdown from the denormalized daily counters
+        # (day granularity, maintained on Event writes in signals.py)
+        event_types = EventDailyCount.objects.filter(
+            project=project, day__gte=timezone.localdate(start_date)
+        ).values('event_type').annotate(count=Sum('count'))
+
+        # Sessions stats (separate base table)
+        total_sessions = Session.objects.filter(project=project, start_time__gte=start_date).count()
+
+        data = {
+            'total_events': totals['total_events'],
+            'event_types': list(event_types),
+            'total_prompts': totals['total_prompts'],
+            'avg_prompt_tokens': totals['avg_prompt_tokens'] or 0,
+            'total_responses': totals['total_responses'],
+            'avg_response_tokens': totals['avg_response_tokens'] or 0,
+            'avg_latency': totals['avg_latency'] or 0,
+            'total_feedback': totals['total_feedback'],
+            'avg_rating': totals['avg_rating'] or 0,
             'total_sessions': total_sessions
-        })
+        }
+        cache.set(cache_key, data, timeout=STATS_CACHE_TIMEOUT)
+        return Response(data)
 
 
 class SessionViewSet(viewsets.ModelViewSet):
@@ -147,7 +183,13 @@ class SessionViewSet(viewsets.ModelViewSet):
         """
         Filter sessions by project and user_id
         """
-        queryset = Session.objects.all()
+        # Duration is computed by the DB during the scan instead of
+        # per row in Python (see SessionSerializer.duration)
+        queryset = Session.objects.annotate(
+            duration_sec=ExpressionWrapper(
+                F('end_time') - F('start_time'), output_field=DurationField()
+            )
+        )
         
         # Filter by project
         project_id = self.request.query_params.get('project', None)
@@ -160,8 +202,7 @@ class SessionViewSet(viewsets.ModelViewSet):
             queryset = queryset.filter(user_id=user_id)
         
         # Only return sessions for projects the user has access to
-        user = self.request.user
-        return queryset.filter(Q(project__owner=user) | Q(project__members=user)).distinct()
+        return queryset.filter(project_id__in=self.request.accessible_project_ids)
     
     @action(detail=True, methods=['post'])
     def end_session(self, request, pk=None):
@@ -179,7 +220,19 @@ class SessionViewSet(viewsets.ModelViewSet):
         Get all events for a session
         """
         session = self.get_object()
-        events = Event.objects.filter(session=session)
+        events = Event.objects.filter(session=session).select_related(
+            'project', 'user_prompt', 'ai_response', 'feedback'
+        ).order_by('-timestamp')
+
+        # ?stream=1 sends the full set as a streamed JSON array
+        if request.query_params.get('stream'):
+            return stream_events(events)
+
+        page = self.paginate_queryset(events)
+        if page is not None:
+            serializer = EventSerializer(page, many=True)
+            return self.get_paginated_response(serializer.data)
+
         serializer = EventSerializer(events, many=True)
         return Response(serializer.data)
 
@@ -197,6 +250,12 @@ class EventViewSet(viewsets.ModelViewSet):
         if self.action == 'create':
             return EventCreateSerializer
         return EventSerializer
+
+    def list(self, request, *args, **kwargs):
+        # ?stream=1 sends the full set as a streamed JSON array
+        if request.query_params.get('stream'):
+            return stream_events(self.filter_queryset(self.get_queryset()))
+        return super().list(request, *args, **kwargs)
     
     def get_queryset(self):
         """
@@ -219,9 +278,25 @@ class EventViewSet(viewsets.ModelViewSet):
         if event_type:
             queryset = queryset.filter(event_type=event_type)
         
-        # Only return events for projects the user has access to
-        user = self.request.user
-        return queryset.filter(Q(project__owner=user) | Q(project__members=user)).distinct()
+        # Only return events for projects the user has access to,
+        # newest first (ordered after filtering so the composite
+        # (project, -timestamp) index can serve the sort)
+        return queryset.filter(
+            project_id__in=self.request.accessible_project_ids
+        ).select_related(
+            'project', 'session', 'user_prompt', 'ai_response', 'feedback'
+        ).order_by('-timestamp')
+
+    @action(detail=False, methods=['post'])
+    def bulk(self, request):
+        """
+        Ingest a list of events (with optional nested children) in one
+        request, written with bulk_create instead of per-row INSERTs
+        """
+        serializer = EventCreateSerializer(data=request.data, many=True)
+        serializer.is_valid(raise_exception=True)
+        events = serializer.save()
+        return Response({'created': len(events)}, status=status.HTTP_201_CREATED)
 
 
 class UserPromptViewSet(viewsets.ReadOnlyModelViewSet):
@@ -234,17 +309,23 @@ class UserPromptViewSet(viewsets.ReadOnlyModelViewSet):
     filter_backends = [filters.SearchFilter, filters.OrderingFilter]
     search_fields = ['prompt_text', 'model_name']
     ordering_fields = ['tokens']
-    
+
+    def get_serializer_class(self):
+        # Skip the unbounded prompt_text column when listing
+        if self.action == 'list':
+            return UserPromptListSerializer
+        return UserPromptSerializer
+
     def get_queryset(self):
         """
         Filter prompts by project and model_name
         """
         queryset = UserPrompt.objects.all()
         
-        # Filter by project
+        # Filter by project (denormalized column, no JOIN through Event)
         project_id = self.request.query_params.get('project', None)
         if project_id:
-            queryset = queryset.filter(event__project_id=project_id)
+            queryset = queryset.filter(project_id=project_id)
         
         # Filter by model_name
         model_name = self.request.query_params.get('model_name', None)
@@ -252,10 +333,12 @@ class UserPromptViewSet(viewsets.ReadOnlyModelViewSet):
             queryset = queryset.filter(model_name=model_name)
         
         # Only return prompts for projects the user has access to
-        user = self.request.user
-        return queryset.filter(
-            Q(event__project__owner=user) | Q(event__project__members=user)
-        ).distinct()
+        queryset = queryset.filter(project_id__in=self.request.accessible_project_ids)
+
+        # List rows don't need the prompt body
+        if self.action == 'list':
+            queryset = queryset.only('id', 'event', 'model_name', 'tokens')
+        return queryset
 
 
 class AIResponseViewSet(viewsets.ReadOnlyModelViewSet):
@@ -268,17 +351,23 @@ class AIResponseViewSet(viewsets.ReadOnlyModelViewSet):
     filter_backends = [filters.SearchFilter, filters.OrderingFilter]
     search_fields = ['response_text', 'model_name']
     ordering_fields = ['tokens', 'latency']
-    
+
+    def get_serializer_class(self):
+        # Skip the unbounded response_text column when listing
+        if self.action == 'list':
+            return AIResponseListSerializer
+        return AIResponseSerializer
+
     def get_queryset(self):
         """
         Filter responses by project and model_name
         """
         queryset = AIResponse.objects.all()
         
-        # Filter by project
+        # Filter by project (denormalized column, no JOIN through Event)
         project_id = self.request.query_params.get('project', None)
         if project_id:
-            queryset = queryset.filter(event__project_id=project_id)
+            queryset = queryset.filter(project_id=project_id)
         
         # Filter by model_name
         model_name = self.request.query_params.get('model_name', None)
@@ -286,10 +375,24 @@ class AIResponseViewSet(viewsets.ReadOnlyModelViewSet):
             queryset = queryset.filter(model_name=model_name)
         
         # Only return responses for projects the user has access to
-        user = self.request.user
-        return queryset.filter(
-            Q(event__project__owner=user) | Q(event__project__members=user)
-        ).distinct()
+        queryset = queryset.filter(project_id__in=self.request.accessible_project_ids)
+
+        # List rows don't need the response body
+        if self.action == 'list':
+            queryset = queryset.only('id', 'event', 'prompt', 'model_name', 'tokens', 'latency')
+        return queryset
+
+    @action(detail=False, methods=['get'])
+    def flat(self, request):
+        """
+        Flat response rows straight from .values() — no model
+        instances and no per-row serializer field loop
+        """
+        rows = self.get_queryset().values('id', 'event_id', 'model_name', 'tokens', 'latency')
+        page = self.paginate_queryset(rows)
+        if page is not None:
+            return self.get_paginated_response(page)
+        return Response(list(rows))
 
 
 class FeedbackViewSet(viewsets.ModelViewSet):
@@ -309,10 +412,10 @@ class FeedbackViewSet(viewsets.ModelViewSet):
         """
         queryset = Feedback.objects.all()
         
-        # Filter by project
+        # Filter by project (denormalized column, no JOIN through Event)
         project_id = self.request.query_params.get('project', None)
         if project_id:
-            queryset = queryset.filter(event__project_id=project_id)
+            queryset = queryset.filter(project_id=project_id)
         
         # Filter by rating
         rating = self.request.query_params.get('rating', None)
@@ -320,10 +423,7 @@ class FeedbackViewSet(viewsets.ModelViewSet):
             queryset = queryset.filter(rating=rating)
         
         # Only return feedback for projects the user has access to
-        user = self.request.user
-        return queryset.filter(
-            Q(event__project__owner=user) | Q(event__project__members=user)
-        ).distinct()
+        return queryset.filter(project_id__in=self.request.accessible_project_ids)
 
 
 class TagViewSet(viewsets.ModelViewSet):
@@ -346,10 +446,7 @@ class TagViewSet(viewsets.ModelViewSet):
             queryset = queryset.filter(project_id=project_id)
         
         # Only return tags for projects the user has access to
-        user = self.request.user
-        return queryset.filter(
-            Q(project__owner=user) | Q(project__members=user)
-        ).distinct()
+        return queryset.filter(project_id__in=self.request.accessible_project_ids)
 
 
 class DashboardViewSet(viewsets.ModelViewSet):
@@ -372,10 +469,9 @@ class DashboardViewSet(viewsets.ModelViewSet):
             queryset = queryset.filter(project_id=project_id)
         
         # Only return dashboards for projects the user has access to
-        user = self.request.user
         return queryset.filter(
-            Q(project__owner=user) | Q(project__members=user)
-        ).distinct()
+            project_id__in=self.request.accessible_project_ids
+        ).prefetch_related('widgets')
 
 
 class WidgetViewSet(viewsets.ModelViewSet):
@@ -398,10 +494,7 @@ class WidgetViewSet(viewsets.ModelViewSet):
             queryset = queryset.filter(dashboard_id=dashboard_id)
         
         # Only return widgets for dashboards in projects the user has access to
-        user = self.request.user
-        return queryset.filter(
-            Q(dashboard__project__owner=user) | Q(dashboard__project__members=user)
-        ).distinct()
+        return queryset.filter(dashboard__project_id__in=self.request.accessible_project_ids)
 
 
 class UserViewSet(viewsets.ReadOnlyModelViewSet):